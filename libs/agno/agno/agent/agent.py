@@ -5,7 +5,6 @@ from collections import ChainMap, deque
 from dataclasses import dataclass
 from inspect import iscoroutinefunction
 from os import getenv
-from textwrap import dedent
 from typing import (
     Any,
     AsyncIterator,
@@ -41,6 +40,7 @@ from agno.exceptions import (
 from agno.guardrails import BaseGuardrail
 from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.types import KnowledgeFilter
+from agno.knowledge.utils import AGENT_KNOWLEDGE_FILTERS_PROMPT
 from agno.media import Audio, File, Image, Video
 from agno.memory import MemoryManager
 from agno.models.base import Model
@@ -5397,7 +5397,7 @@ class Agent:
         session_state: Optional[Dict[str, Any]] = None,
         dependencies: Optional[Dict[str, Any]] = None,
     ) -> List[Union[Function, dict]]:
-        _function_names = []
+        _function_names: Set[str] = set()
         _functions: List[Union[Function, dict]] = []
         self._tool_instructions = []
 
@@ -5426,7 +5426,7 @@ class Agent:
                     for name, _func in tool.functions.items():
                         if name in _function_names:
                             continue
-                        _function_names.append(name)
+                        _function_names.add(name)
 
                         _func._agent = self
                         _func.process_entrypoint(strict=strict)
@@ -5444,7 +5444,7 @@ class Agent:
                 elif isinstance(tool, Function):
                     if tool.name in _function_names:
                         continue
-                    _function_names.append(tool.name)
+                    _function_names.add(tool.name)
 
                     tool._agent = self
                     tool.process_entrypoint(strict=strict)
@@ -5465,7 +5465,7 @@ class Agent:
 
                         if function_name in _function_names:
                             continue
-                        _function_names.append(function_name)
+                        _function_names.add(function_name)
 
                         _func = Function.from_callable(tool, strict=strict)
                         _func._agent = self
@@ -6612,25 +6612,7 @@ class Agent:
             if valid_filters:
                 valid_filters_str = ", ".join(valid_filters)
                 additional_information.append(
-                    dedent(
-                        f"""
-                    The knowledge base contains documents with these metadata filters: {valid_filters_str}.
-                    Always use filters when the user query indicates specific metadata.
-
-                    Examples:
-                    1. If the user asks about a specific person like "Jordan Mitchell", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like user_id>': '<valid value based on the user query>'}}.
-                    2. If the user asks about a specific document type like "contracts", you MUST use the search_knowledge_base tool with the filters parameter set to {{'document_type': 'contract'}}.
-                    4. If the user asks about a specific location like "documents from New York", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like location>': 'New York'}}.
-
-                    General Guidelines:
-                    - Always analyze the user query to identify relevant metadata.
-                    - Use the most specific filter(s) possible to narrow down results.
-                    - If multiple filters are relevant, combine them in the filters parameter (e.g., {{'name': 'Jordan Mitchell', 'document_type': 'contract'}}).
-                    - Ensure the filter keys match the valid metadata filters: {valid_filters_str}.
-
-                    You can use the search_knowledge_base tool to search the knowledge base and get the most relevant documents. Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUCTURE STRICTLY.
-                """
-                    )
+                    AGENT_KNOWLEDGE_FILTERS_PROMPT.format(valid_filters_str=valid_filters_str)
                 )
 
         # 3.3 Build the default system message for the Agent.
@@ -6954,25 +6936,7 @@ class Agent:
             if valid_filters:
                 valid_filters_str = ", ".join(valid_filters)
                 additional_information.append(
-                    dedent(
-                        f"""
-                    The knowledge base contains documents with these metadata filters: {valid_filters_str}.
-                    Always use filters when the user query indicates specific metadata.
-
-                    Examples:
-                    1. If the user asks about a specific person like "Jordan Mitchell", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like user_id>': '<valid value based on the user query>'}}.
-                    2. If the user asks about a specific document type like "contracts", you MUST use the search_knowledge_base tool with the filters parameter set to {{'document_type': 'contract'}}.
-                    4. If the user asks about a specific location like "documents from New York", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like location>': 'New York'}}.
-
-                    General Guidelines:
-                    - Always analyze the user query to identify relevant metadata.
-                    - Use the most specific filter(s) possible to narrow down results.
-                    - If multiple filters are relevant, combine them in the filters parameter (e.g., {{'name': 'Jordan Mitchell', 'document_type': 'contract'}}).
-                    - Ensure the filter keys match the valid metadata filters: {valid_filters_str}.
-
-                    You can use the search_knowledge_base tool to search the knowledge base and get the most relevant documents. Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUCTURE STRICTLY.
-                """
-                    )
+                    AGENT_KNOWLEDGE_FILTERS_PROMPT.format(valid_filters_str=valid_filters_str)
                 )
 
         # 3.3 Build the default system message for the Agent.
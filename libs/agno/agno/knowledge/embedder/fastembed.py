@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from agno.knowledge.embedder.base import Embedder
@@ -18,16 +19,47 @@ except ImportError:
     raise ImportError("fastembed not installed, use pip install fastembed")
 
 
+@lru_cache(maxsize=8)
+def _load_text_embedding(model_name: str, threads: Optional[int], lazy_load: bool) -> TextEmbedding:
+    """Load a FastEmbed model once per process and share it between embedders using the same settings.
+
+    The cache is bounded, so processes that cycle through many models do not keep every ONNX session alive.
+    """
+    return TextEmbedding(model_name=model_name, threads=threads, lazy_load=lazy_load)
+
+
 @dataclass
 class FastEmbedEmbedder(Embedder):
-    """Using BAAI/bge-small-en-v1.5 model, more models available: https://qdrant.github.io/fastembed/examples/Supported_Models/"""
+    """Using BAAI/bge-small-en-v1.5 model, more models available: https://qdrant.github.io/fastembed/examples/Supported_Models/
+
+    FastEmbed serves the default model from an INT8-quantized ONNX export, so it already runs quantized on CPU.
+    Prefer models listed as quantized on the supported models page when picking a different `id`.
+
+    Set `enable_batch=True` to embed documents in batches of `batch_size`. `parallel` enables FastEmbed's
+    data-parallel encoding for those batches (0 uses all cores), and `threads` caps ONNX intra-op threads.
+    `lazy_load` defers loading the ONNX model until the first embedding, and lets each `parallel` worker
+    load its own copy instead of the parent process.
+    """
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: Optional[int] = 384
+    batch_size: int = 256
+    threads: Optional[int] = None
+    parallel: Optional[int] = None
+    lazy_load: bool = True
+    fastembed_client: Optional[TextEmbedding] = None
+
+    @property
+    def client(self) -> TextEmbedding:
+        # Loading the ONNX model is expensive, so build it on first use and reuse it afterwards
+        if self.fastembed_client:
+            return self.fastembed_client
+
+        self.fastembed_client = _load_text_embedding(self.id, threads=self.threads, lazy_load=self.lazy_load)
+        return self.fastembed_client
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
+        embeddings = self.client.embed(text)
         embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
             return embedding_list.tolist()
@@ -60,3 +92,31 @@ class FastEmbedEmbedder(Embedder):
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts in a single FastEmbed call.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        logger.info(f"Getting embeddings for {len(texts)} texts in batches of {self.batch_size}")
+        embeddings = self.client.embed(texts, batch_size=self.batch_size, parallel=self.parallel)
+        all_embeddings = [
+            embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding) for embedding in embeddings
+        ]
+        # Currently, FastEmbed does not provide usage information
+        return all_embeddings, [None] * len(all_embeddings)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using thread executor for CPU-bound operations."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        # Run the CPU-bound operation in a thread executor
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
@@ -8,7 +8,7 @@ from functools import cached_property
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple, Union, cast, overload
 
 from httpx import AsyncClient
 
@@ -42,6 +42,8 @@ class Knowledge:
     contents_db: Optional[Union[BaseDb, AsyncBaseDb]] = None
     max_results: int = 10
     readers: Optional[Dict[str, Reader]] = None
+    # Maximum number of contents add_contents loads at the same time
+    max_concurrency: int = 8
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -77,12 +79,13 @@ class Knowledge:
     ) -> None: ...
 
     async def add_contents_async(self, *args, **kwargs) -> None:
+        tasks: List[Coroutine[Any, Any, None]]
         if args and isinstance(args[0], list):
             arguments = args[0]
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                await self.add_content_async(
+            tasks = [
+                self.add_content_async(
                     name=argument.get("name"),
                     description=argument.get("description"),
                     path=argument.get("path"),
@@ -97,6 +100,10 @@ class Knowledge:
                     skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
                     remote_content=argument.get("remote_content", None),
                 )
+                for argument in arguments
+            ]
+            await self._gather_content_tasks(tasks)
+            await self._optimize_vector_db()
 
         elif kwargs:
             name = kwargs.get("name", [])
@@ -112,68 +119,82 @@ class Knowledge:
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
             remote_content = kwargs.get("remote_content", None)
+            tasks = []
             for path in paths:
-                await self.add_content_async(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                tasks.append(
+                    self.add_content_async(
+                        name=name,
+                        description=description,
+                        path=path,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
             for url in urls:
-                await self.add_content_async(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                tasks.append(
+                    self.add_content_async(
+                        name=name,
+                        description=description,
+                        url=url,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
             for i, text_content in enumerate(text_contents):
                 content_name = f"{name}_{i}" if name else f"text_content_{i}"
                 log_debug(f"Adding text content: {content_name}")
-                await self.add_content_async(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                tasks.append(
+                    self.add_content_async(
+                        name=content_name,
+                        description=description,
+                        text_content=text_content,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
             if topics:
-                await self.add_content_async(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                tasks.append(
+                    self.add_content_async(
+                        name=name,
+                        description=description,
+                        topics=topics,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
 
             if remote_content:
-                await self.add_content_async(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                tasks.append(
+                    self.add_content_async(
+                        name=name,
+                        metadata=metadata,
+                        description=description,
+                        remote_content=remote_content,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
 
+            await self._gather_content_tasks(tasks)
+            await self._optimize_vector_db()
+
         else:
             raise ValueError("Invalid usage of add_contents.")
 
@@ -359,6 +380,37 @@ class Knowledge:
             )
         )
 
+    async def _gather_content_tasks(self, tasks: List[Coroutine[Any, Any, None]]) -> None:
+        """
+        Run content loading tasks concurrently, so slow fetches and embeddings of one content
+        do not block the others. At most `max_concurrency` contents are loaded at the same time.
+
+        Every task runs to completion before the first failure is raised, so no load is left running
+        in the background.
+
+        Args:
+            tasks: The add_content_async coroutines to run
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _run(task: Coroutine[Any, Any, None]) -> None:
+            async with semaphore:
+                await task
+
+        results = await asyncio.gather(*(_run(task) for task in tasks), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            log_error(f"Error adding content: {error}")
+        if errors:
+            raise errors[0]
+
+    async def _optimize_vector_db(self) -> None:
+        """Optimize the vector database once after a batch of contents was added, if it asks for it."""
+        if self.vector_db is None or not self.vector_db.optimize_after_insert():
+            return
+        # Optimizing is blocking I/O, so keep it off the event loop
+        await asyncio.to_thread(self.vector_db.optimize)
+
     def _should_skip(self, content_hash: str, skip_if_exists: bool) -> bool:
         """
         Handle the skip_if_exists logic for content that already exists in the vector database.
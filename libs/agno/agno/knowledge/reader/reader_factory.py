@@ -9,6 +9,8 @@ class ReaderFactory:
 
     # Cache for instantiated readers
     _reader_cache: Dict[str, Reader] = {}
+    # Cache for the sorted reader keys, reset when a new reader is registered
+    _reader_keys: Optional[List[str]] = None
 
     @classmethod
     def _get_pdf_reader(cls, **kwargs) -> Reader:
@@ -256,6 +258,9 @@ class ReaderFactory:
     @classmethod
     def get_all_reader_keys(cls) -> List[str]:
         """Get all available reader keys in priority order."""
+        if cls._reader_keys is not None:
+            return list(cls._reader_keys)
+
         # Extract reader keys from method names
 
         PREFIX = "_get_"
@@ -283,7 +288,8 @@ class ReaderFactory:
                 return (1, reader_key)
 
         reader_keys.sort(key=sort_key)
-        return reader_keys
+        cls._reader_keys = reader_keys
+        return list(reader_keys)
 
     @classmethod
     def create_all_readers(cls) -> Dict[str, Reader]:
@@ -311,3 +317,4 @@ class ReaderFactory:
         # Add the reader method to the class
         method_name = f"_get_{key}_reader"
         setattr(cls, method_name, classmethod(reader_method))
+        cls._reader_keys = None
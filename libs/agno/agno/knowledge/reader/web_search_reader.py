@@ -2,7 +2,7 @@ import asyncio
 import random
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional, Set
+from typing import List, Literal, NamedTuple, Optional, Set
 from urllib.parse import urlparse
 
 import httpx
@@ -25,6 +25,14 @@ except ImportError:
     raise ImportError("The `ddgs` package is not installed. Please install it via `pip install ddgs`.")
 
 
+class SearchResult(NamedTuple):
+    """A single web search hit"""
+
+    title: str
+    url: str
+    description: str
+
+
 @dataclass
 class WebSearchReader(Reader):
     """Reader that uses web search to find content for a given query"""
@@ -79,7 +87,7 @@ class WebSearchReader(Reader):
 
         self._last_search_time = time.time()
 
-    def _perform_duckduckgo_search(self, query: str) -> List[Dict[str, str]]:
+    def _perform_duckduckgo_search(self, query: str) -> List[SearchResult]:
         """Perform web search using DuckDuckGo with rate limiting"""
         log_debug(f"Performing DuckDuckGo search for: {query}")
 
@@ -94,11 +102,11 @@ class WebSearchReader(Reader):
                 results = []
                 for result in search_results:
                     results.append(
-                        {
-                            "title": result.get("title", ""),
-                            "url": result.get("href", ""),
-                            "description": result.get("body", ""),
-                        }
+                        SearchResult(
+                            title=result.get("title", ""),
+                            url=result.get("href", ""),
+                            description=result.get("body", ""),
+                        )
                     )
 
                 log_debug(f"Found {len(results)} search results")
@@ -121,7 +129,7 @@ class WebSearchReader(Reader):
                     return []
         return []
 
-    def _perform_google_search(self, query: str) -> List[Dict[str, str]]:
+    def _perform_google_search(self, query: str) -> List[SearchResult]:
         """Perform web search using Google (requires googlesearch-python)"""
         log_debug(f"Performing Google search for: {query}")
 
@@ -146,11 +154,11 @@ class WebSearchReader(Reader):
                 for result in result_list:
                     # The search function returns URLs as strings
                     results.append(
-                        {
-                            "title": "",  # Google search doesn't provide titles directly
-                            "url": result,
-                            "description": "",  # Google search doesn't provide descriptions directly
-                        }
+                        SearchResult(
+                            title="",  # Google search doesn't provide titles directly
+                            url=result,
+                            description="",  # Google search doesn't provide descriptions directly
+                        )
                     )
 
                 log_debug(f"Found {len(results)} Google search results")
@@ -166,7 +174,7 @@ class WebSearchReader(Reader):
 
         return []
 
-    def _perform_web_search(self, query: str) -> List[Dict[str, str]]:
+    def _perform_web_search(self, query: str) -> List[SearchResult]:
         """Perform web search using the configured search engine"""
         if self.search_engine == "duckduckgo":
             return self._perform_duckduckgo_search(query)
@@ -233,19 +241,19 @@ class WebSearchReader(Reader):
         logger.error(f"Failed to fetch content from {url} after {self.max_retries} attempts")
         return None
 
-    def _create_document_from_url(self, url: str, content: str, search_result: Dict[str, str]) -> Document:
+    def _create_document_from_url(self, url: str, content: str, search_result: SearchResult) -> Document:
         """Create a Document object from URL content and search result metadata"""
         # Use the URL as the document ID
         doc_id = url
 
-        # Use the search result title as the document name, fallback to URL
-        doc_name = search_result.get("title", urlparse(url).netloc)
+        # Use the search result title as the document name
+        doc_name = search_result.title
 
         # Create metadata with search information
         meta_data = {
             "url": url,
-            "search_title": search_result.get("title", ""),
-            "search_description": search_result.get("description", ""),
+            "search_title": search_result.title,
+            "search_description": search_result.description,
             "source": "web_search",
             "search_engine": self.search_engine,
         }
@@ -268,7 +276,7 @@ class WebSearchReader(Reader):
         documents: List[Document] = []
 
         for result in search_results:
-            url = result.get("url", "")
+            url = result.url
 
             # Skip if URL is invalid or already visited
             if not self._is_valid_url(url):
@@ -317,8 +325,8 @@ class WebSearchReader(Reader):
             return []
 
         # Create tasks for fetching content from each URL
-        async def fetch_url_async(result: Dict[str, str]) -> Optional[Document]:
-            url = result.get("url", "")
+        async def fetch_url_async(result: SearchResult) -> Optional[Document]:
+            url = result.url
 
             # Skip if URL is invalid or already visited
             if not self._is_valid_url(url):
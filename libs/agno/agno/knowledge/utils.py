@@ -1,9 +1,49 @@
-from typing import Dict, List
+from textwrap import dedent
+from typing import Dict, List, Optional
 
 from agno.knowledge.reader.reader_factory import ReaderFactory
 from agno.knowledge.types import ContentType
 from agno.utils.log import log_debug
 
+# System message templates for agentic knowledge filters, formatted with `valid_filters_str`.
+# Dedented once at import. The Team variant has no blank lines between sections.
+AGENT_KNOWLEDGE_FILTERS_PROMPT = dedent(
+    """
+    The knowledge base contains documents with these metadata filters: {valid_filters_str}.
+    Always use filters when the user query indicates specific metadata.
+
+    Examples:
+    1. If the user asks about a specific person like "Jordan Mitchell", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like user_id>': '<valid value based on the user query>'}}.
+    2. If the user asks about a specific document type like "contracts", you MUST use the search_knowledge_base tool with the filters parameter set to {{'document_type': 'contract'}}.
+    4. If the user asks about a specific location like "documents from New York", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like location>': 'New York'}}.
+
+    General Guidelines:
+    - Always analyze the user query to identify relevant metadata.
+    - Use the most specific filter(s) possible to narrow down results.
+    - If multiple filters are relevant, combine them in the filters parameter (e.g., {{'name': 'Jordan Mitchell', 'document_type': 'contract'}}).
+    - Ensure the filter keys match the valid metadata filters: {valid_filters_str}.
+
+    You can use the search_knowledge_base tool to search the knowledge base and get the most relevant documents. Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUCTURE STRICTLY.
+"""
+)
+
+TEAM_KNOWLEDGE_FILTERS_PROMPT = dedent(
+    """
+    The knowledge base contains documents with these metadata filters: {valid_filters_str}.
+    Always use filters when the user query indicates specific metadata.
+    Examples:
+    1. If the user asks about a specific person like "Jordan Mitchell", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like user_id>': '<valid value based on the user query>'}}.
+    2. If the user asks about a specific document type like "contracts", you MUST use the search_knowledge_base tool with the filters parameter set to {{'document_type': 'contract'}}.
+    4. If the user asks about a specific location like "documents from New York", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like location>': 'New York'}}.
+    General Guidelines:
+    - Always analyze the user query to identify relevant metadata.
+    - Use the most specific filter(s) possible to narrow down results.
+    - If multiple filters are relevant, combine them in the filters parameter (e.g., {{'name': 'Jordan Mitchell', 'document_type': 'contract'}}).
+    - Ensure the filter keys match the valid metadata filters: {valid_filters_str}.
+    You can use the search_knowledge_base tool to search the knowledge base and get the most relevant documents. Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUCTURE STRICTLY.
+"""
+)
+
 
 def _get_chunker_class(strategy_type):
     """Get the chunker class for a given strategy type without instantiation."""
@@ -91,14 +131,19 @@ def get_all_readers_info() -> List[Dict]:
     return readers_info
 
 
-def get_content_types_to_readers_mapping() -> Dict[str, List[str]]:
+def get_content_types_to_readers_mapping(readers_info: Optional[List[Dict]] = None) -> Dict[str, List[str]]:
     """Get mapping of content types to list of reader IDs that support them.
 
+    Args:
+        readers_info: Reader information already returned by get_all_readers_info(), to avoid
+            instantiating every reader again. Collected from scratch if not provided.
+
     Returns:
         Dictionary mapping content type strings (ContentType enum values) to list of reader IDs.
     """
     content_type_mapping: Dict[str, List[str]] = {}
-    readers_info = get_all_readers_info()
+    if readers_info is None:
+        readers_info = get_all_readers_info()
 
     for reader_info in readers_info:
         reader_id = reader_info["id"]
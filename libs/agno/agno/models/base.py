@@ -1557,10 +1557,9 @@ class Model(ABC):
             if fc.function.requires_user_input:
                 user_input_schema = fc.function.user_input_schema
                 if fc.arguments and user_input_schema:
-                    for name, value in fc.arguments.items():
-                        for user_input_field in user_input_schema:
-                            if user_input_field.name == name:
-                                user_input_field.value = value
+                    for user_input_field in user_input_schema:
+                        if user_input_field.name in fc.arguments:
+                            user_input_field.value = fc.arguments[user_input_field.name]
 
                 paused_tool_executions.append(
                     ToolExecution(
@@ -1704,10 +1703,9 @@ class Model(ABC):
             if fc.function.requires_user_input and not skip_pause_check:
                 user_input_schema = fc.function.user_input_schema
                 if fc.arguments and user_input_schema:
-                    for name, value in fc.arguments.items():
-                        for user_input_field in user_input_schema:
-                            if user_input_field.name == name:
-                                user_input_field.value = value
+                    for user_input_field in user_input_schema:
+                        if user_input_field.name in fc.arguments:
+                            user_input_field.value = fc.arguments[user_input_field.name]
 
                 paused_tool_executions.append(
                     ToolExecution(
@@ -887,7 +887,7 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
                     )
 
         # Get content types to readers mapping
-        types_of_readers = get_content_types_to_readers_mapping()
+        types_of_readers = get_content_types_to_readers_mapping(readers_info)
         chunkers_list = get_all_chunkers_info()
 
         # Convert chunkers list to dictionary format expected by schema
@@ -423,6 +423,8 @@ def load_yaml_config(config_file_path: str) -> AgentOSConfig:
 
     import yaml
 
+    from agno.utils.yaml_io import get_yaml_safe_loader_and_dumper
+
     # Validate that the path points to a YAML file
     path = Path(config_file_path)
     if path.suffix.lower() not in [".yaml", ".yml"]:
@@ -430,7 +432,8 @@ def load_yaml_config(config_file_path: str) -> AgentOSConfig:
 
     # Load the YAML file
     with open(config_file_path, "r") as f:
-        return AgentOSConfig.model_validate(yaml.safe_load(f))
+        safe_loader, _ = get_yaml_safe_loader_and_dumper()
+        return AgentOSConfig.model_validate(yaml.load(f, Loader=safe_loader))
 
 
 def collect_mcp_tools_from_team(team: Team, mcp_tools: List[Any]) -> None:
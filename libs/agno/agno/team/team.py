@@ -5,7 +5,6 @@ from collections import ChainMap, deque
 from copy import copy
 from dataclasses import dataclass
 from os import getenv
-from textwrap import dedent
 from typing import (
     Any,
     AsyncIterator,
@@ -39,6 +38,7 @@ from agno.exceptions import (
 from agno.guardrails import BaseGuardrail
 from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.types import KnowledgeFilter
+from agno.knowledge.utils import TEAM_KNOWLEDGE_FILTERS_PROMPT
 from agno.media import Audio, File, Image, Video
 from agno.memory import MemoryManager
 from agno.models.base import Model
@@ -5100,7 +5100,7 @@ class Team:
         if len(_tools) > 0:
             log_debug("Processing tools for model")
 
-        _function_names = []
+        _function_names: Set[str] = set()
         _functions: List[Union[Function, dict]] = []
 
         # Check if we need strict mode for the model
@@ -5120,7 +5120,7 @@ class Team:
                 for name, _func in tool.functions.items():
                     if name in _function_names:
                         continue
-                    _function_names.append(name)
+                    _function_names.add(name)
 
                     _func._team = self
                     _func.process_entrypoint(strict=strict)
@@ -5140,7 +5140,7 @@ class Team:
             elif isinstance(tool, Function):
                 if tool.name in _function_names:
                     continue
-                _function_names.append(tool.name)
+                _function_names.add(tool.name)
 
                 tool._team = self
                 tool.process_entrypoint(strict=strict)
@@ -5160,12 +5160,13 @@ class Team:
             elif callable(tool):
                 # We add the tools, which are callable functions
                 try:
-                    _func = Function.from_callable(tool, strict=strict)
+                    function_name = tool.__name__
 
-                    if _func.name in _function_names:
+                    if function_name in _function_names:
                         continue
-                    _function_names.append(_func.name)
+                    _function_names.add(function_name)
 
+                    _func = Function.from_callable(tool, strict=strict)
                     _func._team = self
                     if strict:
                         _func.strict = True
@@ -5204,36 +5205,37 @@ class Team:
         return _functions
 
     def get_members_system_message_content(self, indent: int = 0) -> str:
-        system_message_content = ""
+        prefix = indent * " "
+        lines: List[str] = []
         for idx, member in enumerate(self.members):
             url_safe_member_id = get_member_id(member)
 
             if isinstance(member, Team):
-                system_message_content += f"{indent * ' '} - Team: {member.name}\n"
-                system_message_content += f"{indent * ' '} - ID: {url_safe_member_id}\n"
+                lines.append(f"{prefix} - Team: {member.name}\n")
+                lines.append(f"{prefix} - ID: {url_safe_member_id}\n")
                 if member.members is not None:
-                    system_message_content += member.get_members_system_message_content(indent=indent + 2)
+                    lines.append(member.get_members_system_message_content(indent=indent + 2))
             else:
-                system_message_content += f"{indent * ' '} - Agent {idx + 1}:\n"
+                lines.append(f"{prefix} - Agent {idx + 1}:\n")
                 if url_safe_member_id is not None:
-                    system_message_content += f"{indent * ' '}   - ID: {url_safe_member_id}\n"
+                    lines.append(f"{prefix}   - ID: {url_safe_member_id}\n")
                 if member.name is not None:
-                    system_message_content += f"{indent * ' '}   - Name: {member.name}\n"
+                    lines.append(f"{prefix}   - Name: {member.name}\n")
                 if member.role is not None:
-                    system_message_content += f"{indent * ' '}   - Role: {member.role}\n"
+                    lines.append(f"{prefix}   - Role: {member.role}\n")
                 if member.tools is not None and member.tools != [] and self.add_member_tools_to_context:
-                    system_message_content += f"{indent * ' '}   - Member tools:\n"
+                    lines.append(f"{prefix}   - Member tools:\n")
                     for _tool in member.tools:
                         if isinstance(_tool, Toolkit):
                             for _func in _tool.functions.values():
                                 if _func.entrypoint:
-                                    system_message_content += f"{indent * ' '}    - {_func.name}\n"
+                                    lines.append(f"{prefix}    - {_func.name}\n")
                         elif isinstance(_tool, Function) and _tool.entrypoint:
-                            system_message_content += f"{indent * ' '}    - {_tool.name}\n"
+                            lines.append(f"{prefix}    - {_tool.name}\n")
                         elif callable(_tool):
-                            system_message_content += f"{indent * ' '}    - {_tool.__name__}\n"
+                            lines.append(f"{prefix}    - {_tool.__name__}\n")
 
-        return system_message_content
+        return "".join(lines)
 
     def get_system_message(
         self,
@@ -5347,22 +5349,7 @@ class Team:
             valid_filters = self.knowledge.get_valid_filters()
             if valid_filters:
                 valid_filters_str = ", ".join(valid_filters)
-                additional_information.append(
-                    dedent(f"""
-                    The knowledge base contains documents with these metadata filters: {valid_filters_str}.
-                    Always use filters when the user query indicates specific metadata.
-                    Examples:
-                    1. If the user asks about a specific person like "Jordan Mitchell", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like user_id>': '<valid value based on the user query>'}}.
-                    2. If the user asks about a specific document type like "contracts", you MUST use the search_knowledge_base tool with the filters parameter set to {{'document_type': 'contract'}}.
-                    4. If the user asks about a specific location like "documents from New York", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like location>': 'New York'}}.
-                    General Guidelines:
-                    - Always analyze the user query to identify relevant metadata.
-                    - Use the most specific filter(s) possible to narrow down results.
-                    - If multiple filters are relevant, combine them in the filters parameter (e.g., {{'name': 'Jordan Mitchell', 'document_type': 'contract'}}).
-                    - Ensure the filter keys match the valid metadata filters: {valid_filters_str}.
-                    You can use the search_knowledge_base tool to search the knowledge base and get the most relevant documents. Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUCTURE STRICTLY.
-                """)
-                )
+                additional_information.append(TEAM_KNOWLEDGE_FILTERS_PROMPT.format(valid_filters_str=valid_filters_str))
 
         # 2 Build the default system message for the Agent.
         system_message_content: str = ""
@@ -5641,22 +5628,7 @@ class Team:
             valid_filters = getattr(self.knowledge, "valid_metadata_filters", None)
             if valid_filters:
                 valid_filters_str = ", ".join(valid_filters)
-                additional_information.append(
-                    dedent(f"""
-                    The knowledge base contains documents with these metadata filters: {valid_filters_str}.
-                    Always use filters when the user query indicates specific metadata.
-                    Examples:
-                    1. If the user asks about a specific person like "Jordan Mitchell", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like user_id>': '<valid value based on the user query>'}}.
-                    2. If the user asks about a specific document type like "contracts", you MUST use the search_knowledge_base tool with the filters parameter set to {{'document_type': 'contract'}}.
-                    4. If the user asks about a specific location like "documents from New York", you MUST use the search_knowledge_base tool with the filters parameter set to {{'<valid key like location>': 'New York'}}.
-                    General Guidelines:
-                    - Always analyze the user query to identify relevant metadata.
-                    - Use the most specific filter(s) possible to narrow down results.
-                    - If multiple filters are relevant, combine them in the filters parameter (e.g., {{'name': 'Jordan Mitchell', 'document_type': 'contract'}}).
-                    - Ensure the filter keys match the valid metadata filters: {valid_filters_str}.
-                    You can use the search_knowledge_base tool to search the knowledge base and get the most relevant documents. Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUCTURE STRICTLY.
-                """)
-                )
+                additional_information.append(TEAM_KNOWLEDGE_FILTERS_PROMPT.format(valid_filters_str=valid_filters_str))
 
         # 2 Build the default system message for the Agent.
         system_message_content: str = ""
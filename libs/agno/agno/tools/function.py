@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from functools import partial
+from functools import lru_cache, partial
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
+from typing import Any, Callable, Dict, FrozenSet, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -14,6 +14,23 @@ from agno.utils.log import log_debug, log_error, log_exception, log_warning
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=256)
+def _cached_parameter_names(func: Callable) -> FrozenSet[str]:
+    from inspect import signature
+
+    return frozenset(signature(func).parameters)
+
+
+def _get_parameter_names(func: Callable) -> FrozenSet[str]:
+    """Return the parameter names of a callable, caching the signature lookup for hashable callables."""
+    try:
+        return _cached_parameter_names(func)
+    except TypeError:
+        from inspect import signature
+
+        return frozenset(signature(func).parameters)
+
+
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
 
@@ -649,20 +666,19 @@ class FunctionCall(BaseModel):
         """Handles the pre-hook for the function call."""
         if self.function.pre_hook is not None:
             try:
-                from inspect import signature
-
+                hook_params = _get_parameter_names(self.function.pre_hook)
                 pre_hook_args = {}
                 # Check if the pre-hook has and agent argument
-                if "agent" in signature(self.function.pre_hook).parameters:
+                if "agent" in hook_params:
                     pre_hook_args["agent"] = self.function._agent
                 # Check if the pre-hook has an team argument
-                if "team" in signature(self.function.pre_hook).parameters:
+                if "team" in hook_params:
                     pre_hook_args["team"] = self.function._team
                 # Check if the pre-hook has an session_state argument
-                if "session_state" in signature(self.function.pre_hook).parameters:
+                if "session_state" in hook_params:
                     pre_hook_args["session_state"] = self.function._session_state
                 # Check if the pre-hook has an fc argument
-                if "fc" in signature(self.function.pre_hook).parameters:
+                if "fc" in hook_params:
                     pre_hook_args["fc"] = self
                 self.function.pre_hook(**pre_hook_args)
             except AgentRunException as e:
@@ -677,20 +693,19 @@ class FunctionCall(BaseModel):
         """Handles the post-hook for the function call."""
         if self.function.post_hook is not None:
             try:
-                from inspect import signature
-
+                hook_params = _get_parameter_names(self.function.post_hook)
                 post_hook_args = {}
                 # Check if the post-hook has and agent argument
-                if "agent" in signature(self.function.post_hook).parameters:
+                if "agent" in hook_params:
                     post_hook_args["agent"] = self.function._agent
                 # Check if the post-hook has an team argument
-                if "team" in signature(self.function.post_hook).parameters:
+                if "team" in hook_params:
                     post_hook_args["team"] = self.function._team
                 # Check if the post-hook has an session_state argument
-                if "session_state" in signature(self.function.post_hook).parameters:
+                if "session_state" in hook_params:
                     post_hook_args["session_state"] = self.function._session_state
                 # Check if the post-hook has an fc argument
-                if "fc" in signature(self.function.post_hook).parameters:
+                if "fc" in hook_params:
                     post_hook_args["fc"] = self
                 self.function.post_hook(**post_hook_args)
             except AgentRunException as e:
@@ -703,67 +718,65 @@ class FunctionCall(BaseModel):
 
     def _build_entrypoint_args(self) -> Dict[str, Any]:
         """Builds the arguments for the entrypoint."""
-        from inspect import signature
-
+        entrypoint_params = _get_parameter_names(self.function.entrypoint)  # type: ignore
         entrypoint_args = {}
         # Check if the entrypoint has an agent argument
-        if "agent" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "agent" in entrypoint_params:
             entrypoint_args["agent"] = self.function._agent
         # Check if the entrypoint has an team argument
-        if "team" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "team" in entrypoint_params:
             entrypoint_args["team"] = self.function._team
         # Check if the entrypoint has an session_state argument
-        if "session_state" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "session_state" in entrypoint_params:
             entrypoint_args["session_state"] = self.function._session_state
         # Check if the entrypoint has an dependencies argument
-        if "dependencies" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "dependencies" in entrypoint_params:
             entrypoint_args["dependencies"] = self.function._dependencies
         # Check if the entrypoint has an fc argument
-        if "fc" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "fc" in entrypoint_params:
             entrypoint_args["fc"] = self
 
         # Check if the entrypoint has media arguments
-        if "images" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "images" in entrypoint_params:
             entrypoint_args["images"] = self.function._images
-        if "videos" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "videos" in entrypoint_params:
             entrypoint_args["videos"] = self.function._videos
-        if "audios" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "audios" in entrypoint_params:
             entrypoint_args["audios"] = self.function._audios
-        if "files" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "files" in entrypoint_params:
             entrypoint_args["files"] = self.function._files
         return entrypoint_args
 
     def _build_hook_args(self, hook: Callable, name: str, func: Callable, args: Dict[str, Any]) -> Dict[str, Any]:
         """Build the arguments for the hook."""
-        from inspect import signature
-
+        hook_params = _get_parameter_names(hook)
         hook_args = {}
         # Check if the hook has an agent argument
-        if "agent" in signature(hook).parameters:
+        if "agent" in hook_params:
             hook_args["agent"] = self.function._agent
         # Check if the hook has an team argument
-        if "team" in signature(hook).parameters:
+        if "team" in hook_params:
             hook_args["team"] = self.function._team
         # Check if the hook has an session_state argument
-        if "session_state" in signature(hook).parameters:
+        if "session_state" in hook_params:
             hook_args["session_state"] = self.function._session_state
         # Check if the hook has an dependencies argument
-        if "dependencies" in signature(hook).parameters:
+        if "dependencies" in hook_params:
             hook_args["dependencies"] = self.function._dependencies
 
-        if "name" in signature(hook).parameters:
+        if "name" in hook_params:
             hook_args["name"] = name
-        if "function_name" in signature(hook).parameters:
+        if "function_name" in hook_params:
             hook_args["function_name"] = name
-        if "function" in signature(hook).parameters:
+        if "function" in hook_params:
             hook_args["function"] = func
-        if "func" in signature(hook).parameters:
+        if "func" in hook_params:
             hook_args["func"] = func
-        if "function_call" in signature(hook).parameters:
+        if "function_call" in hook_params:
             hook_args["function_call"] = func
-        if "args" in signature(hook).parameters:
+        if "args" in hook_params:
             hook_args["args"] = args
-        if "arguments" in signature(hook).parameters:
+        if "arguments" in hook_params:
             hook_args["arguments"] = args
         return hook_args
 
@@ -893,20 +906,19 @@ class FunctionCall(BaseModel):
         """Handles the async pre-hook for the function call."""
         if self.function.pre_hook is not None:
             try:
-                from inspect import signature
-
+                hook_params = _get_parameter_names(self.function.pre_hook)
                 pre_hook_args = {}
                 # Check if the pre-hook has an agent argument
-                if "agent" in signature(self.function.pre_hook).parameters:
+                if "agent" in hook_params:
                     pre_hook_args["agent"] = self.function._agent
                 # Check if the pre-hook has an team argument
-                if "team" in signature(self.function.pre_hook).parameters:
+                if "team" in hook_params:
                     pre_hook_args["team"] = self.function._team
                 # Check if the pre-hook has an session_state argument
-                if "session_state" in signature(self.function.pre_hook).parameters:
+                if "session_state" in hook_params:
                     pre_hook_args["session_state"] = self.function._session_state
                 # Check if the pre-hook has an fc argument
-                if "fc" in signature(self.function.pre_hook).parameters:
+                if "fc" in hook_params:
                     pre_hook_args["fc"] = self
 
                 await self.function.pre_hook(**pre_hook_args)
@@ -922,21 +934,20 @@ class FunctionCall(BaseModel):
         """Handles the async post-hook for the function call."""
         if self.function.post_hook is not None:
             try:
-                from inspect import signature
-
+                hook_params = _get_parameter_names(self.function.post_hook)
                 post_hook_args = {}
                 # Check if the post-hook has an agent argument
-                if "agent" in signature(self.function.post_hook).parameters:
+                if "agent" in hook_params:
                     post_hook_args["agent"] = self.function._agent
                 # Check if the post-hook has an team argument
-                if "team" in signature(self.function.post_hook).parameters:
+                if "team" in hook_params:
                     post_hook_args["team"] = self.function._team
                 # Check if the post-hook has an session_state argument
-                if "session_state" in signature(self.function.post_hook).parameters:
+                if "session_state" in hook_params:
                     post_hook_args["session_state"] = self.function._session_state
 
                 # Check if the post-hook has an fc argument
-                if "fc" in signature(self.function.post_hook).parameters:
+                if "fc" in hook_params:
                     post_hook_args["fc"] = self
 
                 await self.function.post_hook(**post_hook_args)
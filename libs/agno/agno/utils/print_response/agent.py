@@ -1,6 +1,21 @@
 import json
 from collections.abc import Set
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union, cast, get_args
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+)
 
 from pydantic import BaseModel
 from rich.console import Group
@@ -22,6 +37,101 @@ from agno.utils.timer import Timer
 if TYPE_CHECKING:
     from agno.agent.agent import Agent
 
+# Minimum number of seconds between two re-renders of streamed content
+STREAM_RENDER_INTERVAL = 0.1
+
+T = TypeVar("T")
+
+
+def _is_content_event(event: Any) -> bool:
+    return (
+        isinstance(event, tuple(get_args(RunOutputEvent))) and cast(RunOutputEvent, event).event == RunEvent.run_content
+    )
+
+
+def _with_render_hints(events: Iterator[T]) -> Iterator[Tuple[T, bool]]:
+    """Pair each streamed event with whether the live display should be rebuilt for it.
+
+    Rebuilding the panels re-parses the whole response as Markdown, so content events are only
+    rendered every STREAM_RENDER_INTERVAL seconds. Other events are always rendered. The decision is
+    made as soon as an event arrives, so the caller has to render once more if the last event was skipped.
+    """
+    last_render = 0.0
+    for event in events:
+        now = monotonic()
+        render = not _is_content_event(event) or now - last_render >= STREAM_RENDER_INTERVAL
+        if render:
+            last_render = now
+        yield event, render
+
+
+async def _awith_render_hints(events: AsyncIterator[T]) -> AsyncIterator[Tuple[T, bool]]:
+    """Async version of _with_render_hints"""
+    last_render = 0.0
+    async for event in events:
+        now = monotonic()
+        render = not _is_content_event(event) or now - last_render >= STREAM_RENDER_INTERVAL
+        if render:
+            last_render = now
+        yield event, render
+
+
+def _build_response_panels(
+    status: Status,
+    input_content: str,
+    show_message: bool,
+    response_content_stream: str,
+    response_content_batch: Union[str, JSON, Markdown],
+    markdown: bool,
+    tags_to_include_in_markdown: Set[str],
+    response_event: RunOutputEvent,
+    response_timer: Timer,
+    response_reasoning_content_buffer: str,
+    reasoning_steps: List[ReasoningStep],
+    show_reasoning: bool,
+    show_full_reasoning: bool,
+    accumulated_tool_calls: List,
+) -> List[Any]:
+    """Build the live display panels for the response streamed so far."""
+    # Escape special tags before markdown conversion
+    if markdown:
+        escaped_content = escape_markdown_tags(response_content_stream, tags_to_include_in_markdown)  # type: ignore
+        response_content_batch = Markdown(escaped_content)
+
+    # Check if we have any response content to display
+    if response_content_stream and not markdown:
+        response_content = response_content_stream
+    else:
+        response_content = response_content_batch  # type: ignore
+
+    # Sanitize empty Markdown content
+    if isinstance(response_content, Markdown):
+        if not (response_content.markup and response_content.markup.strip()):
+            response_content = None  # type: ignore
+
+    panels: List[Any] = [status]
+    if show_message:
+        # Convert message to a panel
+        message_panel = create_panel(
+            content=Text(input_content, style="green"),
+            title="Message",
+            border_style="cyan",
+        )
+        panels.append(message_panel)
+
+    additional_panels = build_panels_stream(
+        response_content=response_content,
+        response_event=response_event,
+        response_timer=response_timer,
+        response_reasoning_content_buffer=response_reasoning_content_buffer,
+        reasoning_steps=reasoning_steps,
+        show_reasoning=show_reasoning,
+        show_full_reasoning=show_full_reasoning,
+        accumulated_tool_calls=accumulated_tool_calls,
+    )
+    panels.extend(additional_panels)
+    return panels
+
 
 def print_response_stream(
     agent: "Agent",
@@ -84,25 +194,28 @@ def print_response_stream(
         # Consider both stream_events and stream_intermediate_steps (deprecated)
         stream_events = stream_events or stream_intermediate_steps
 
-        for response_event in agent.run(
-            input=input,
-            session_id=session_id,
-            session_state=session_state,
-            user_id=user_id,
-            audio=audio,
-            images=images,
-            videos=videos,
-            files=files,
-            stream=True,
-            stream_events=stream_events,
-            knowledge_filters=knowledge_filters,
-            debug_mode=debug_mode,
-            add_history_to_context=add_history_to_context,
-            add_dependencies_to_context=add_dependencies_to_context,
-            add_session_state_to_context=add_session_state_to_context,
-            dependencies=dependencies,
-            metadata=metadata,
-            **kwargs,
+        render_event = True
+        for response_event, render_event in _with_render_hints(
+            agent.run(  # type: ignore
+                input=input,
+                session_id=session_id,
+                session_state=session_state,
+                user_id=user_id,
+                audio=audio,
+                images=images,
+                videos=videos,
+                files=files,
+                stream=True,
+                stream_events=stream_events,
+                knowledge_filters=knowledge_filters,
+                debug_mode=debug_mode,
+                add_history_to_context=add_history_to_context,
+                add_dependencies_to_context=add_dependencies_to_context,
+                add_session_state_to_context=add_session_state_to_context,
+                dependencies=dependencies,
+                metadata=metadata,
+                **kwargs,
+            )
         ):
             if isinstance(response_event, tuple(get_args(RunOutputEvent))):
                 if response_event.is_paused:  # type: ignore
@@ -146,36 +259,37 @@ def print_response_stream(
                 if hasattr(response_event, "reasoning_steps") and response_event.reasoning_steps is not None:  # type: ignore
                     reasoning_steps = response_event.reasoning_steps  # type: ignore
 
-            # Escape special tags before markdown conversion
-            if markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)  # type: ignore
-                response_content_batch = Markdown(escaped_content)
-
-            response_content_stream: str = _response_content
-
-            # Check if we have any response content to display
-            if response_content_stream and not markdown:
-                response_content = response_content_stream
-            else:
-                response_content = response_content_batch  # type: ignore
-
-            # Sanitize empty Markdown content
-            if isinstance(response_content, Markdown):
-                if not (response_content.markup and response_content.markup.strip()):
-                    response_content = None  # type: ignore
-
-            panels = [status]
-            if show_message:
-                # Convert message to a panel
-                message_panel = create_panel(
-                    content=Text(input_content, style="green"),
-                    title="Message",
-                    border_style="cyan",
-                )
-                panels.append(message_panel)
+            if not render_event:
+                continue
+
+            panels = _build_response_panels(
+                status=status,
+                input_content=input_content,
+                show_message=show_message,
+                response_content_stream=_response_content,
+                response_content_batch=response_content_batch,
+                markdown=markdown,
+                tags_to_include_in_markdown=tags_to_include_in_markdown,
+                response_event=response_event,  # type: ignore
+                response_timer=response_timer,
+                response_reasoning_content_buffer=_response_reasoning_content,
+                reasoning_steps=reasoning_steps,
+                show_reasoning=show_reasoning,
+                show_full_reasoning=show_full_reasoning,
+                accumulated_tool_calls=accumulated_tool_calls,
+            )
+            live_log.update(Group(*panels))
 
-            additional_panels = build_panels_stream(
-                response_content=response_content,
+        # Content events can be skipped while streaming, so render the final state of the response
+        if not render_event:
+            panels = _build_response_panels(
+                status=status,
+                input_content=input_content,
+                show_message=show_message,
+                response_content_stream=_response_content,
+                response_content_batch=response_content_batch,
+                markdown=markdown,
+                tags_to_include_in_markdown=tags_to_include_in_markdown,
                 response_event=response_event,  # type: ignore
                 response_timer=response_timer,
                 response_reasoning_content_buffer=_response_reasoning_content,
@@ -184,9 +298,7 @@ def print_response_stream(
                 show_full_reasoning=show_full_reasoning,
                 accumulated_tool_calls=accumulated_tool_calls,
             )
-            panels.extend(additional_panels)
-            if panels:
-                live_log.update(Group(*panels))
+            live_log.update(Group(*panels))
 
         if agent.memory_manager is not None and agent.memory_manager.memories_updated:
             memory_panel = create_panel(
@@ -297,7 +409,8 @@ async def aprint_response_stream(
 
         input_content = get_text_from_message(input)
 
-        async for resp in result:  # type: ignore
+        render_event = True
+        async for resp, render_event in _awith_render_hints(result):  # type: ignore
             if isinstance(resp, tuple(get_args(RunOutputEvent))):
                 if resp.is_paused:
                     response_panel = create_paused_run_output_panel(resp)  # type: ignore
@@ -337,38 +450,37 @@ async def aprint_response_stream(
                 if hasattr(resp, "reasoning_steps") and resp.reasoning_steps is not None:  # type: ignore
                     reasoning_steps = resp.reasoning_steps  # type: ignore
 
-            response_content_stream: str = _response_content
-
-            # Escape special tags before markdown conversion
-            if markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)  # type: ignore
-                response_content_batch = Markdown(escaped_content)
-
-            # Check if we have any response content to display
-            if response_content_stream and not markdown:
-                response_content = response_content_stream
-            else:
-                response_content = response_content_batch  # type: ignore
-
-            # Sanitize empty Markdown content
-            if isinstance(response_content, Markdown):
-                if not (response_content.markup and response_content.markup.strip()):
-                    response_content = None  # type: ignore
-
-            panels = [status]
-
-            if input_content and show_message:
-                render = True
-                # Convert message to a panel
-                message_panel = create_panel(
-                    content=Text(input_content, style="green"),
-                    title="Message",
-                    border_style="cyan",
-                )
-                panels.append(message_panel)
+            if not render_event:
+                continue
+
+            panels = _build_response_panels(
+                status=status,
+                input_content=input_content,
+                show_message=bool(input_content) and show_message,
+                response_content_stream=_response_content,
+                response_content_batch=response_content_batch,
+                markdown=markdown,
+                tags_to_include_in_markdown=tags_to_include_in_markdown,
+                response_event=resp,  # type: ignore
+                response_timer=response_timer,
+                response_reasoning_content_buffer=_response_reasoning_content,
+                reasoning_steps=reasoning_steps,
+                show_reasoning=show_reasoning,
+                show_full_reasoning=show_full_reasoning,
+                accumulated_tool_calls=accumulated_tool_calls,
+            )
+            live_log.update(Group(*panels))
 
-            additional_panels = build_panels_stream(
-                response_content=response_content,
+        # Content events can be skipped while streaming, so render the final state of the response
+        if not render_event:
+            panels = _build_response_panels(
+                status=status,
+                input_content=input_content,
+                show_message=bool(input_content) and show_message,
+                response_content_stream=_response_content,
+                response_content_batch=response_content_batch,
+                markdown=markdown,
+                tags_to_include_in_markdown=tags_to_include_in_markdown,
                 response_event=resp,  # type: ignore
                 response_timer=response_timer,
                 response_reasoning_content_buffer=_response_reasoning_content,
@@ -377,9 +489,7 @@ async def aprint_response_stream(
                 show_full_reasoning=show_full_reasoning,
                 accumulated_tool_calls=accumulated_tool_calls,
             )
-            panels.extend(additional_panels)
-            if panels:
-                live_log.update(Group(*panels))
+            live_log.update(Group(*panels))
 
         if agent.memory_manager is not None and agent.memory_manager.memories_updated:
             memory_panel = create_panel(
@@ -1,15 +1,27 @@
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from agno.utils.log import log_debug, logger
 
 
+def get_yaml_safe_loader_and_dumper() -> Tuple[Any, Any]:
+    """Return PyYAML's safe Loader and Dumper, using the libyaml C implementations when available."""
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader  # type: ignore
+
+    return SafeLoader, SafeDumper
+
+
 def read_yaml_file(file_path: Optional[Path]) -> Optional[Dict[str, Any]]:
     if file_path is not None and file_path.exists() and file_path.is_file():
         import yaml
 
+        safe_loader, _ = get_yaml_safe_loader_and_dumper()
         log_debug(f"Reading {file_path}")
-        data_from_file = yaml.safe_load(file_path.read_text())
+        data_from_file = yaml.load(file_path.read_text(), Loader=safe_loader)
         if data_from_file is not None and isinstance(data_from_file, dict):
             return data_from_file
         else:
@@ -21,5 +33,6 @@ def write_yaml_file(file_path: Optional[Path], data: Optional[Dict[str, Any]], *
     if file_path is not None and data is not None:
         import yaml
 
+        _, safe_dumper = get_yaml_safe_loader_and_dumper()
         log_debug(f"Writing {file_path}")
-        file_path.write_text(yaml.safe_dump(data, **kwargs))
+        file_path.write_text(yaml.dump(data, Dumper=safe_dumper, **kwargs))
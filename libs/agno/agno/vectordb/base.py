@@ -100,6 +100,10 @@ class VectorDb(ABC):
     def optimize(self) -> None:
         raise NotImplementedError
 
+    def optimize_after_insert(self) -> bool:
+        """Whether Knowledge should call optimize() once after adding a batch of contents."""
+        return False
+
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
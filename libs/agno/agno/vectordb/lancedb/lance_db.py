@@ -370,6 +370,12 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
+        # Drop documents that are already stored before embedding, so unchanged content is never re-embedded
+        documents = [document for document in documents if not await self.async_doc_exists(document)]
+        if not documents:
+            log_debug("No new data to insert")
+            return
+
         if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
             # Use batch embedding when enabled and supported
             try:
@@ -410,9 +416,6 @@ class LanceDb(VectorDb):
             await asyncio.gather(*embed_tasks, return_exceptions=True)
 
         for document in documents:
-            if await self.async_doc_exists(document):
-                continue
-
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
@@ -711,6 +714,7 @@ class LanceDb(VectorDb):
             self.connection.drop_table(self.table_name)  # type: ignore
             # Clear the table reference after dropping
             self.table = None
+            self.fts_index_exists = False
 
     async def async_drop(self) -> None:
         """Drop the table asynchronously."""
@@ -720,6 +724,7 @@ class LanceDb(VectorDb):
             await conn.drop_table(self.table_name)
             # Clear the async table reference after dropping
             self.async_table = None
+            self.fts_index_exists = False
 
     def exists(self) -> bool:
         # If we have an async table that was created, the table exists
@@ -771,8 +776,26 @@ class LanceDb(VectorDb):
             return self.table.count_rows()
         return 0
 
+    def optimize_after_insert(self) -> bool:
+        """Compacting fragments and rebuilding the full text search index pays off once per batch of inserts."""
+        return True
+
     def optimize(self) -> None:
-        pass
+        """Compact the fragments created by many small inserts and bring the table indexes up to date."""
+        if self.table is None:
+            log_debug("Table not initialized, nothing to optimize")
+            return
+
+        try:
+            self.table.optimize()
+            # Rebuild the full text search index once for the whole batch, so keyword and hybrid
+            # searches see the new rows without rebuilding it on every write
+            if self.search_type in [SearchType.keyword, SearchType.hybrid]:
+                self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
+                self.fts_index_exists = True
+            log_debug(f"Optimized table: {self.table_name}")
+        except Exception as e:
+            logger.warning(f"Could not optimize table '{self.table_name}': {e}")
 
     def delete(self) -> bool:
         return False
@@ -825,6 +848,13 @@ class LanceDb(VectorDb):
             logger.error(f"Error deleting rows by id '{id}': {e}")
             return False
 
+    def _delete_ids(self, ids: List[str]) -> None:
+        """Delete all rows with the given IDs in a single delete call."""
+        if self.table is None:
+            return
+        ids_str = ", ".join(f"'{doc_id}'" for doc_id in ids)
+        self.table.delete(f"{self._id} IN ({ids_str})")
+
     def delete_by_name(self, name: str) -> bool:
         """Delete content by name."""
         if self.table is None:
@@ -844,8 +874,7 @@ class LanceDb(VectorDb):
 
             # Delete matching records
             if ids_to_delete:
-                for doc_id in ids_to_delete:
-                    self.table.delete(f"{self._id} = '{doc_id}'")
+                self._delete_ids(ids_to_delete)
                 log_info(f"Deleted {len(ids_to_delete)} records with name '{name}' from table '{self.table_name}'.")
                 return True
             else:
@@ -884,8 +913,7 @@ class LanceDb(VectorDb):
 
             # Delete matching records
             if ids_to_delete:
-                for doc_id in ids_to_delete:
-                    self.table.delete(f"{self._id} = '{doc_id}'")
+                self._delete_ids(ids_to_delete)
                 log_info(
                     f"Deleted {len(ids_to_delete)} records with metadata '{metadata}' from table '{self.table_name}'."
                 )
@@ -917,8 +945,7 @@ class LanceDb(VectorDb):
 
             # Delete matching records
             if ids_to_delete:
-                for doc_id in ids_to_delete:
-                    self.table.delete(f"{self._id} = '{doc_id}'")
+                self._delete_ids(ids_to_delete)
                 log_info(
                     f"Deleted {len(ids_to_delete)} records with content_id '{content_id}' from table '{self.table_name}'."
                 )
@@ -950,8 +977,7 @@ class LanceDb(VectorDb):
 
             # Delete matching records
             if ids_to_delete:
-                for doc_id in ids_to_delete:
-                    self.table.delete(f"{self._id} = '{doc_id}'")
+                self._delete_ids(ids_to_delete)
                 log_info(
                     f"Deleted {len(ids_to_delete)} records with content_hash '{content_hash}' from table '{self.table_name}'."
                 )
@@ -1040,23 +1066,9 @@ class LanceDb(VectorDb):
                 else:
                     current_payload["filters"] = metadata
 
-                # Update the document
-                update_data = {"id": row_id, "payload": json.dumps(current_payload)}
-
-                # LanceDB doesn't have a direct update, so we need to delete and re-insert
-                # First, get all the existing data
-                vector_data = row["vector"] if "vector" in row else None
-                text_data = row["text"] if "text" in row else None
-
-                # Create complete update record
-                if vector_data is not None:
-                    update_data["vector"] = vector_data
-                if text_data is not None:
-                    update_data["text"] = text_data
-
-                # Delete old record and insert updated one
-                self.table.delete(f"id = '{row_id}'")
-                self.table.add([update_data])
+                # Only the payload changes, so update it in place instead of deleting and re-adding the row.
+                # This keeps the stored vector and avoids rewriting the whole record.
+                self.table.update(where=f"{self._id} = '{row_id}'", values={"payload": json.dumps(current_payload)})
                 updated_count += 1
 
             logger.debug(f"Updated metadata for {updated_count} documents with content_id: {content_id}")
@@ -0,0 +1,93 @@
+import importlib
+import sys
+import types
+from typing import Any, List
+
+import numpy as np
+import pytest
+
+
+class StubTextEmbedding:
+    instances: List["StubTextEmbedding"] = []
+
+    def __init__(self, model_name: str, threads: Any = None, lazy_load: bool = False) -> None:
+        self.model_name = model_name
+        self.threads = threads
+        self.lazy_load = lazy_load
+        self.embed_calls: List[dict] = []
+        StubTextEmbedding.instances.append(self)
+
+    def embed(self, documents: Any, batch_size: int = 256, parallel: Any = None):
+        texts = [documents] if isinstance(documents, str) else list(documents)
+        self.embed_calls.append({"texts": texts, "batch_size": batch_size, "parallel": parallel})
+        for i, _ in enumerate(texts):
+            yield np.array([float(i), 1.0])
+
+
+@pytest.fixture
+def fastembed_module(monkeypatch):
+    """Import the FastEmbed embedder against a stub `fastembed` package"""
+    StubTextEmbedding.instances = []
+    stub = types.ModuleType("fastembed")
+    stub.TextEmbedding = StubTextEmbedding  # type: ignore
+    monkeypatch.setitem(sys.modules, "fastembed", stub)
+    monkeypatch.delitem(sys.modules, "agno.knowledge.embedder.fastembed", raising=False)
+
+    module = importlib.import_module("agno.knowledge.embedder.fastembed")
+    yield module
+
+    module._load_text_embedding.cache_clear()
+    sys.modules.pop("agno.knowledge.embedder.fastembed", None)
+
+
+def test_embedders_with_the_same_model_share_one_load(fastembed_module):
+    first = fastembed_module.FastEmbedEmbedder()
+    second = fastembed_module.FastEmbedEmbedder()
+
+    assert first.client is second.client
+    assert len(StubTextEmbedding.instances) == 1
+    assert StubTextEmbedding.instances[0].lazy_load is True
+
+
+def test_different_settings_load_separate_models(fastembed_module):
+    default = fastembed_module.FastEmbedEmbedder()
+    threaded = fastembed_module.FastEmbedEmbedder(threads=2)
+    eager = fastembed_module.FastEmbedEmbedder(lazy_load=False)
+
+    assert len({id(default.client), id(threaded.client), id(eager.client)}) == 3
+    assert [(m.threads, m.lazy_load) for m in StubTextEmbedding.instances] == [(None, True), (2, True), (None, False)]
+
+
+def test_client_is_built_once_across_get_embedding_calls(fastembed_module, mocker):
+    load = mocker.spy(fastembed_module, "_load_text_embedding")
+    embedder = fastembed_module.FastEmbedEmbedder()
+
+    assert embedder.get_embedding("first") == [0.0, 1.0]
+    assert embedder.get_embedding("second") == [0.0, 1.0]
+
+    assert load.call_count == 1
+    assert len(StubTextEmbedding.instances) == 1
+    assert len(StubTextEmbedding.instances[0].embed_calls) == 2
+
+
+def test_batch_embedding_forwards_batch_settings(fastembed_module):
+    embedder = fastembed_module.FastEmbedEmbedder(batch_size=2, parallel=0)
+    texts = ["a", "b", "c"]
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(texts)
+
+    assert embeddings == [[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+    assert usages == [None] * len(texts)
+    assert StubTextEmbedding.instances[0].embed_calls == [{"texts": texts, "batch_size": 2, "parallel": 0}]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_embedding_matches_sync(fastembed_module):
+    embedder = fastembed_module.FastEmbedEmbedder(batch_size=2)
+    texts = ["a", "b"]
+
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(texts)
+
+    assert embeddings == [[0.0, 1.0], [1.0, 1.0]]
+    assert usages == [None, None]
+    assert StubTextEmbedding.instances[0].embed_calls[0]["batch_size"] == 2
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 import pytest
@@ -167,3 +168,65 @@ async def test_add_content_async_replaces_invalid_surrogates() -> None:
     docs = fake_db.get_all_inserted_documents()
     contents = "\n".join([getattr(d, "content", "") for d in docs])
     assert "\ufffd" in contents or "�" in contents or "?" in contents
+
+
+def test_add_contents_sync_loads_every_text_content() -> None:
+    fake_db = FakeVectorDb()
+    kb = Knowledge(vector_db=fake_db)
+    kb.add_contents(text_contents=UTF8_SAMPLES, name="sample")
+    for text in UTF8_SAMPLES:
+        _assert_insert_contains_text(fake_db, text)
+    assert len(fake_db._inserted) == len(UTF8_SAMPLES)
+
+
+class OptimizingVectorDb(FakeVectorDb):
+    def __init__(self, optimize_after_insert: bool) -> None:
+        super().__init__()
+        self._optimize_after_insert = optimize_after_insert
+        self.optimize_calls = 0
+
+    def optimize(self) -> None:
+        self.optimize_calls += 1
+
+    def optimize_after_insert(self) -> bool:
+        return self._optimize_after_insert
+
+
+def test_add_contents_optimizes_vector_db_once() -> None:
+    fake_db = OptimizingVectorDb(optimize_after_insert=True)
+    kb = Knowledge(vector_db=fake_db)
+    kb.add_contents(text_contents=UTF8_SAMPLES, name="sample")
+    assert len(fake_db._inserted) == len(UTF8_SAMPLES)
+    assert fake_db.optimize_calls == 1
+
+
+def test_add_contents_skips_optimize_unless_vector_db_asks_for_it() -> None:
+    fake_db = OptimizingVectorDb(optimize_after_insert=False)
+    kb = Knowledge(vector_db=fake_db)
+    kb.add_contents(text_contents=UTF8_SAMPLES, name="sample")
+    assert len(fake_db._inserted) == len(UTF8_SAMPLES)
+    assert fake_db.optimize_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_gather_content_tasks_finishes_every_load_before_raising() -> None:
+    kb = Knowledge(vector_db=FakeVectorDb(), max_concurrency=2)
+    running = 0
+    max_running = 0
+    finished: List[int] = []
+
+    async def load(i: int) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if i == 0:
+            raise RuntimeError("rate limited")
+        finished.append(i)
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        await kb._gather_content_tasks([load(i) for i in range(5)])
+
+    assert sorted(finished) == [1, 2, 3, 4]
+    assert max_running == 2
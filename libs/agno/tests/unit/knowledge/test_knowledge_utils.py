@@ -0,0 +1,15 @@
+from agno.knowledge import utils
+from agno.knowledge.utils import get_content_types_to_readers_mapping
+
+
+def test_content_types_mapping_reuses_readers_info(mocker):
+    get_all_readers_info = mocker.patch.object(utils, "get_all_readers_info")
+    readers_info = [
+        {"id": "text", "content_types": [".txt"]},
+        {"id": "markdown", "content_types": [".md", ".txt"]},
+    ]
+
+    mapping = get_content_types_to_readers_mapping(readers_info)
+
+    assert mapping == {".txt": ["text", "markdown"], ".md": ["markdown"]}
+    get_all_readers_info.assert_not_called()
@@ -0,0 +1,28 @@
+from agno.knowledge.reader.reader_factory import ReaderFactory
+from agno.knowledge.reader.text_reader import TextReader
+
+
+def test_get_all_reader_keys_is_cached():
+    keys = ReaderFactory.get_all_reader_keys()
+
+    assert keys[0] == "website"
+    assert "text" in keys
+    # Mutating the returned list does not affect the cached keys
+    keys.clear()
+    assert ReaderFactory.get_all_reader_keys() != []
+
+
+def test_register_reader_refreshes_reader_keys():
+    assert "custom_text" not in ReaderFactory.get_all_reader_keys()
+
+    ReaderFactory.register_reader(
+        key="custom_text",
+        reader_method=lambda cls, **kwargs: TextReader(**kwargs),
+        name="CustomTextReader",
+        description="Custom text reader",
+    )
+    try:
+        assert "custom_text" in ReaderFactory.get_all_reader_keys()
+    finally:
+        delattr(ReaderFactory, "_get_custom_text_reader")
+        ReaderFactory._reader_keys = None
@@ -0,0 +1,43 @@
+from agno.run.agent import RunCompletedEvent, RunContentEvent
+from agno.utils.print_response.agent import _with_render_hints
+
+
+def test_render_hints_throttle_content_events():
+    events = [RunContentEvent(content=str(i)) for i in range(50)]
+
+    hints = list(_with_render_hints(iter(events)))
+
+    assert [event for event, _ in hints] == events
+    # The first chunk renders immediately, back-to-back chunks are skipped
+    assert hints[0][1] is True
+    assert sum(render for _, render in hints) < len(events)
+
+
+def test_render_hints_always_render_non_content_events():
+    events = [
+        RunContentEvent(content="a"),
+        RunContentEvent(content="b"),
+        RunCompletedEvent(),
+        RunContentEvent(content="c"),
+    ]
+
+    hints = list(_with_render_hints(iter(events)))
+
+    assert hints[2] == (events[2], True)
+
+
+def test_render_hints_yield_each_event_on_arrival():
+    pulled = []
+
+    def stream():
+        for i in range(3):
+            pulled.append(i)
+            yield RunContentEvent(content=str(i))
+
+    hints = _with_render_hints(stream())
+
+    event, render = next(hints)
+    # The first event is handed over without waiting for the next one
+    assert event.content == "0"
+    assert render is True
+    assert pulled == [0]
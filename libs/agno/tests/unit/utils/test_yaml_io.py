@@ -0,0 +1,20 @@
+import yaml
+
+from agno.utils.yaml_io import get_yaml_safe_loader_and_dumper, read_yaml_file, write_yaml_file
+
+
+def test_safe_loader_and_dumper_prefer_libyaml():
+    safe_loader, safe_dumper = get_yaml_safe_loader_and_dumper()
+
+    assert safe_loader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert safe_dumper is getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def test_write_and_read_yaml_file_round_trip(tmp_path):
+    file_path = tmp_path / "config.yaml"
+    data = {"name": "agent", "tools": ["search", "calculator"], "settings": {"markdown": True}}
+
+    write_yaml_file(file_path, data, sort_keys=False)
+
+    assert file_path.read_text().startswith("name: agent")
+    assert read_yaml_file(file_path) == data
@@ -103,6 +103,23 @@ def test_hybrid_search(lance_db, sample_documents):
     assert any("thai" in doc.content.lower() for doc in results)
 
 
+@pytest.mark.asyncio
+async def test_async_insert_skips_embedding_existing_documents(lance_db, sample_documents):
+    """Test that documents already in the table are not embedded again"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    lance_db.insert(documents=sample_documents, content_hash="test_hash")
+
+    embedder = MagicMock(enable_batch=False, dimensions=1024)
+    embedder.async_get_embedding_and_usage = AsyncMock(return_value=([0.1] * 1024, None))
+    lance_db.embedder = embedder
+
+    await lance_db.async_insert(documents=sample_documents, content_hash="test_hash")
+
+    embedder.async_get_embedding_and_usage.assert_not_called()
+    assert lance_db.get_count() == 3
+
+
 def test_upsert_documents(lance_db, sample_documents):
     """Test upserting documents"""
     lance_db.insert(documents=[sample_documents[0]], content_hash="test_hash")
@@ -362,6 +379,20 @@ def test_update_metadata(lance_db, sample_documents):
     assert updated_doc_found, "Updated document not found"
 
 
+def test_update_metadata_preserves_vector(lance_db, sample_documents):
+    """Test that updating metadata keeps the stored vector intact"""
+    sample_documents[0].content_id = "doc_1"
+    lance_db.insert(documents=sample_documents[:1], content_hash="test_hash")
+
+    before = lance_db.table.search().select(["id", "vector"]).to_pandas()
+    lance_db.update_metadata("doc_1", {"updated": True})
+    after = lance_db.table.search().select(["id", "vector"]).to_pandas()
+
+    assert lance_db.get_count() == 1
+    assert after["id"][0] == before["id"][0]
+    assert list(after["vector"][0]) == list(before["vector"][0])
+
+
 def test_update_metadata_nonexistent_content_id(lance_db, sample_documents):
     """Test updating metadata for non-existent content_id"""
     # Add content_id to sample documents
@@ -452,3 +483,31 @@ def test_content_hash_exists(lance_db, sample_documents):
 
     # Should still return False for non-existent hash
     assert lance_db.content_hash_exists("nonexistent_hash") is False
+
+
+def test_optimize_keeps_documents(lance_db, sample_documents):
+    """Test that optimizing after several small inserts keeps all documents searchable"""
+    for document in sample_documents:
+        lance_db.insert(documents=[document], content_hash=f"hash_{document.name}")
+
+    lance_db.optimize()
+
+    assert lance_db.get_count() == 3
+    assert len(lance_db.search("coconut", limit=3)) == 3
+
+
+def test_optimize_rebuilds_fts_index_once_per_batch(lance_db, sample_documents, mocker):
+    """Test that writes leave the full text search index alone and optimize rebuilds it once"""
+    lance_db.search_type = SearchType.keyword
+    lance_db.use_tantivy = False
+    create_fts_index = mocker.spy(lance_db.table, "create_fts_index")
+
+    for document in sample_documents:
+        lance_db.insert(documents=[document], content_hash=f"hash_{document.name}")
+    lance_db.delete_by_name("tom_kha")
+    assert create_fts_index.call_count == 0
+
+    lance_db.optimize()
+    assert create_fts_index.call_count == 1
+    assert lance_db.fts_index_exists is True
+    assert len(lance_db.search("curry", limit=2)) == 1